@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Optional Cython build for hot per-event modules
+================================================
+Compiles src/models.py (event normalization and datetime formatting,
+run once per event on every tool call) to a native extension. The
+compiled module is picked up automatically next to the .py source;
+without it the pure-Python module is used unchanged.
+
+Usage (from the repository root):
+    pip install cython setuptools
+    python scripts/build_cython.py build_ext --inplace
+
+WARNING: the extension is written next to src/models.py and Python
+imports it in preference to the .py source. A stale build silently hides
+later edits to models.py: rebuild after every change, or remove the
+generated src/models.*.so (or .pyd) to go back to pure Python.
+
+Annotations are not enforced (annotation_typing=False), so the compiled
+module accepts exactly the inputs the pure-Python module accepts.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="indico-mcp-speedups",
+    ext_modules=cythonize(
+        ["src/models.py"],
+        language_level=3,
+        compiler_directives={
+            "infer_types": True,
+            # Keep annotations as hints only: typed arguments would make
+            # None or tuple inputs raise TypeError where Python accepts them
+            "annotation_typing": False
+        }
+    ),
+    zip_safe=False
+)
+
+print(
+    "Built src/models extension. It shadows src/models.py until removed: "
+    "rebuild after editing models.py, or delete src/models.*.so / .pyd."
+)
@@ -11,7 +11,7 @@ source .venv/bin/activate
 pip install --upgrade pip
 
 # Install dependencies
-pip install fastmcp requests python-dotenv
+pip install -r requirements.txt
 
 # Copy example files
 [ ! -f .env ] && cp .env.example .env
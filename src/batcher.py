@@ -0,0 +1,90 @@
+"""
+Micro-batching of concurrent lookups into a single bulk request.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBatcher:
+    """
+    Collect keys submitted within a short window and resolve them together.
+    
+    The first submission opens a window of interval_ms; every key submitted
+    before it closes (or until max_size keys are pending) is passed to one
+    fetch_many call. fetch_many returns a mapping of key to result, where a
+    result may be an exception to raise for that key alone. Duplicate keys
+    within a window share one lookup.
+    """
+    
+    def __init__(
+        self,
+        fetch_many: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+        interval_ms: float = 10,
+        max_size: int = 10
+    ):
+        self._fetch_many = fetch_many
+        self._interval = interval_ms / 1000
+        self._max_size = max_size
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def submit(self, key: Hashable) -> Any:
+        """
+        Queue a key for the current batch and wait for its result.
+        
+        Args:
+            key: Lookup key (e.g. an event ID)
+        
+        Returns:
+            Result returned by fetch_many for this key
+        
+        Raises:
+            Exception: Whatever fetch_many raised or returned for this key
+        """
+        loop = asyncio.get_running_loop()
+        future = self._pending.get(key)
+        if future is None:
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self._max_size:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self._interval, self._flush)
+        # Shielded so one caller's cancellation does not fail the others
+        return await asyncio.shield(future)
+    
+    def _flush(self):
+        """Hand the pending keys to a background fetch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, batch: Dict[Hashable, asyncio.Future]):
+        """Resolve every future in the batch from one fetch_many call."""
+        logger.debug(f"Flushing batch of {len(batch)} keys")
+        try:
+            results = await self._fetch_many(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for key, future in batch.items():
+            if future.done():
+                continue
+            result = results.get(key)
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,89 @@
+"""
+In-process TTL cache for Indico API responses.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Size-bounded cache whose entries expire after a per-entry TTL.
+    
+    Entries are stored as ``key -> (expires_at, stored_at, value)`` in a
+    plain dict; insertion order doubles as age order, so the oldest entry
+    is evicted once maxsize is exceeded. Expired entries are dropped lazily
+    on read. Readers with a shorter lifetime than the writer can pass
+    max_age to reject entries older than they accept.
+    Mutations are guarded by a lock so the cache can be shared between
+    threads as well as coroutines.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: Dict[Hashable, Tuple[float, float, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def get(self, key: Hashable, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        Look up a live entry.
+        
+        Args:
+            key: Cache key
+            max_age: Optional maximum entry age in seconds accepted by this
+                reader, independent of the TTL it was stored with
+        
+        Returns:
+            Cached value, or None if missing, expired or older than max_age
+        """
+        entry = self._data.get(key)
+        if entry is not None:
+            expires_at, stored_at, value = entry
+            now = time.monotonic()
+            if now < expires_at:
+                if max_age is None or now - stored_at <= max_age:
+                    self.hits += 1
+                    return value
+            else:
+                with self._lock:
+                    self._data.pop(key, None)
+        self.misses += 1
+        return None
+    
+    def put(self, key: Hashable, value: Any, ttl: float):
+        """
+        Store a value for ttl seconds, evicting the oldest entry when full.
+        
+        Args:
+            key: Cache key
+            value: Value to cache (must not be None)
+            ttl: Lifetime in seconds
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            now = time.monotonic()
+            self._data[key] = (now + ttl, now, value)
+            while len(self._data) > self.maxsize:
+                self._data.pop(next(iter(self._data)))
+    
+    def clear(self):
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def info(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self.maxsize,
+            "currsize": len(self._data)
+        }
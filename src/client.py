@@ -2,84 +2,400 @@
 Indico API client with retry logic and caching.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
-from functools import lru_cache
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import httpx
+import ijson
+import orjson
 
+from .cache import TTLCache
 from .config import Config
+from .utils import search_key
 
 logger = logging.getLogger(__name__)
 
 
-class IndicoClient:
-    """Handles all Indico API interactions with retry logic and caching."""
+def _bind_config():
+    """Bind Config values read on every request; rerun by Config.reload()."""
+    global _EXPORT, _MAX_RETRIES, _RETRY_BACKOFF, _RETRY_JITTER, _MAX_RETRY_AFTER
+    _EXPORT = Config.INDICO_EXPORT
+    _MAX_RETRIES = Config.MAX_RETRIES
+    _RETRY_BACKOFF = Config.RETRY_BACKOFF
+    _RETRY_JITTER = Config.RETRY_JITTER
+    _MAX_RETRY_AFTER = Config.MAX_RETRY_AFTER
+
+
+_bind_config()
+Config.add_reload_hook(_bind_config)
+
+
+# Response cache shared by all client instances. Keys are
+# ("categ", category_path, start_date, end_date, limit, query) for event lists
+# and ("event", event_id) for event details.
+_CACHE = TTLCache(Config.CACHE_SIZE)
+
+# Negative cache for misses: (url, params) -> outcome, where outcome is a
+# 403/404 status code or an empty-results payload
+_NEG_CACHE = TTLCache(Config.CACHE_SIZE)
+
+# Rate limiting and transient server errors worth retrying
+_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+# Client errors remembered in the negative cache
+_NEGATIVE_STATUSES = frozenset([403, 404])
+
+
+def _cache_put(key: Tuple, value: Any, ttl: float):
+    """Cache a response; empty lists expire sooner so new events show up quickly."""
+    if not value:
+        ttl = min(ttl, Config.EMPTY_CACHE_TTL)
+    _CACHE.put(key, value, ttl)
+
+
+def _cache_clear():
+    """Drop all cached entries and reset statistics."""
+    _CACHE.clear()
+    _NEG_CACHE.clear()
+    logger.info("Cache cleared")
+
+
+def _cache_info() -> Dict[str, Any]:
+    """Get cache statistics."""
+    if not Config.ENABLE_CACHE:
+        return {}
+    info = _CACHE.info()
+    info["ttl"] = {
+        "search": Config.CACHE_TTL,
+        "upcoming": Config.UPCOMING_CACHE_TTL,
+        "details": Config.DETAILS_CACHE_TTL
+    }
+    info["negative_size"] = len(_NEG_CACHE)
+    return info
+
+
+def _negative_get(url: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Replay a recent miss for this request without touching the network.
     
-    def __init__(self):
-        self.session = self._create_session()
-        self.headers = self._setup_headers()
-        self._cache_enabled = Config.ENABLE_CACHE
+    Returns:
+        Cached empty-results payload, or None when nothing is cached
         
-    def _create_session(self) -> requests.Session:
-        """Create session with retry strategy."""
-        session = requests.Session()
-        retry = Retry(
-            total=Config.MAX_RETRIES,
-            backoff_factor=Config.RETRY_BACKOFF,
-            status_forcelist=[500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(max_retries=retry)
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
-        return session
-    
-    def _setup_headers(self) -> Dict[str, str]:
-        """Setup request headers for public-only access."""
-        headers = {"User-Agent": Config.get_user_agent()}
-        logger.info("Client initialized for public events only (authentication disabled)")
-        return headers
-    
-    def _make_request(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Make HTTP request with error handling."""
+    Raises:
+        ValueError: If the request recently failed with 403/404
+    """
+    if not Config.ENABLE_CACHE:
+        return None
+    outcome = _NEG_CACHE.get((url, tuple(sorted(params.items()))))
+    if outcome is None:
+        return None
+    logger.debug(f"Negative cache hit for {url}")
+    if isinstance(outcome, int):
+        raise _status_error(outcome, url)
+    return outcome
+
+
+def _negative_put(url: str, params: Dict[str, Any], outcome: Any, ttl: float):
+    """Remember a 403/404 status or empty payload for ttl seconds."""
+    if not Config.ENABLE_CACHE:
+        return
+    _NEG_CACHE.put((url, tuple(sorted(params.items()))), outcome, ttl)
+
+
+def _remember_outcome(url: str, params: Dict[str, Any], status: int, data: Any = None):
+    """Record 403/404 responses and empty results in the negative cache."""
+    if status in _NEGATIVE_STATUSES:
+        _negative_put(url, params, status, Config.NEGATIVE_CACHE_TTL)
+    elif isinstance(data, dict) and data.get("results") == []:
+        _negative_put(url, params, data, Config.EMPTY_CACHE_TTL)
+
+
+def _prepare_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Precompute per-event search fields once at fetch time.
+    
+    Cached event lists are searched repeatedly, so the title search key
+    (lowercased UTF-8 bytes) is stored under ``_title_key`` instead of
+    being rebuilt on every search. The category/categoryTitle fallback is
+    resolved here too, so normalization finds ``category`` directly.
+    """
+    for event in events:
+        event["_title_key"] = search_key(event.get("title"))
+        if event.get("category") is None:
+            event["category"] = event.get("categoryTitle", "")
+    return events
+
+
+def _events_params(
+    start_date: str,
+    end_date: str,
+    limit: int,
+    query: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build query parameters for a public category export."""
+    params = {
+        "limit": limit,
+        "order": "start",
+        "onlypublic": "yes",
+        "from": start_date,
+        "to": end_date
+    }
+    if query:
+        # Server-side title filter, only sent when INDICO_SUPPORTS_Q is set
+        params["q"] = query
+    return params
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> Optional[float]:
+    """
+    Compute the wait before the next retry.
+    
+    A server-provided Retry-After (seconds or HTTP date) is honoured;
+    otherwise exponential backoff with random jitter is used so retries
+    from many clients do not arrive in synchronized bursts.
+    
+    Args:
+        attempt: Zero-based attempt number that just failed
+        retry_after: Value of the Retry-After response header, if any
+        
+    Returns:
+        Seconds to wait, or None if the server asks for a longer wait
+        than MAX_RETRY_AFTER and the error should be surfaced instead
+    """
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            delay = max(delay, 0.0)
+            return delay if delay <= _MAX_RETRY_AFTER else None
+    return _RETRY_BACKOFF * (2 ** attempt) + random.uniform(0, _RETRY_JITTER)
+
+
+def _status_error(status_code: int, url: str) -> ValueError:
+    """Map an HTTP error status to the user-facing ValueError."""
+    if status_code == 429:
+        logger.error(f"Rate limited by server for {url}")
+        return ValueError("Rate limited by Indico. Please try again later.")
+    if status_code == 404:
+        logger.error("Resource not found")
+        return ValueError("Resource not found.")
+    if status_code == 403:
+        logger.error("Access forbidden - resource may not be public")
+        return ValueError("Access forbidden. This resource may not be public.")
+    logger.error(f"HTTP error {status_code} for {url}")
+    return ValueError(f"Server error: {status_code}")
+
+
+class _ByteStream:
+    """Expose a streamed httpx response as the async file object ijson reads."""
+    
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+    
+    async def read(self, size: int = -1) -> bytes:
+        """Return the next received chunk, or b"" at end of body."""
+        if size == 0:
+            # ijson probes the stream type with read(0); consume nothing
+            return b""
         try:
-            logger.debug(f"API request: {url} with params: {params}")
-            response = self.session.get(
-                url, 
-                params=params, 
-                headers=self.headers, 
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+class AsyncIndicoClient:
+    """
+    Async Indico API client for concurrent fetches.
+    
+    A single keep-alive HTTP/2 httpx client is created lazily and reused
+    across tool invocations, so fan-out over several categories is
+    multiplexed over one TLS connection instead of paying a handshake
+    per call.
+    """
+    
+    def __init__(self):
+        self.headers = {"User-Agent": Config.get_user_agent()}
+        self._http: Optional[httpx.AsyncClient] = None
+        self._cache_enabled = Config.ENABLE_CACHE
+        self._inflight: Dict[Tuple, "asyncio.Future[Any]"] = {}
+    
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._http is None or self._http.is_closed:
+            # HTTP/2 multiplexes concurrent requests over one TLS connection;
+            # the transport retries failed connection attempts
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=Config.MAX_RETRIES,
+                limits=httpx.Limits(
+                    max_keepalive_connections=Config.POOL_MAXSIZE,
+                    max_connections=Config.POOL_MAXSIZE * 2,
+                    keepalive_expiry=Config.KEEPALIVE_TIMEOUT
+                )
+            )
+            self._http = httpx.AsyncClient(
+                transport=transport,
+                headers=self.headers,
                 timeout=Config.REQUEST_TIMEOUT
             )
-            response.raise_for_status()
-            return response.json()
+        return self._http
+    
+    async def close(self):
+        """Close the underlying HTTP client."""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+    
+    async def _make_request(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        handler: Optional[Callable[[httpx.Response], Awaitable[Any]]] = None
+    ) -> Any:
+        """
+        Make async HTTP request with retries and error handling.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            handler: Coroutine consuming a successful, still unread
+                response body (default: parse the whole body as JSON)
             
-        except requests.exceptions.Timeout:
-            logger.error(f"Request timeout for {url}")
-            raise ValueError("Request timed out. Please try again.")
+        Returns:
+            Parsed JSON or the handler's result
+        """
+        if handler is None:
+            cached = _negative_get(url, params)
+            if cached is not None:
+                return cached
+        http = self._get_http()
+        logger.debug(f"Async API request: {url} with params: {params}")
+        
+        for attempt in range(_MAX_RETRIES + 1):
+            try:
+                async with http.stream("GET", url, params=params) as response:
+                    status = response.status_code
+                    if status in _RETRY_STATUSES and attempt < _MAX_RETRIES:
+                        delay = _retry_delay(attempt, response.headers.get("Retry-After"))
+                        if delay is not None:
+                            await asyncio.sleep(delay)
+                            continue
+                    if status >= 400:
+                        _remember_outcome(url, params, status)
+                        raise _status_error(status, url)
+                    if handler is not None:
+                        return await handler(response)
+                    # Parse the raw UTF-8 bytes; .text/.json() would decode via charset detection
+                    data = orjson.loads(await response.aread())
+                    _remember_outcome(url, params, status, data)
+                    return data
+                    
+            except httpx.TimeoutException:
+                logger.error(f"Request timeout for {url}")
+                raise ValueError("Request timed out. Please try again.")
+                
+            except httpx.NetworkError:
+                logger.error(f"Connection error for {url}")
+                raise ValueError("Connection failed. Check your network.")
+                
+            except httpx.HTTPError as e:
+                logger.error(f"Request failed: {e}")
+                raise ValueError(f"Failed to fetch data: {str(e)}")
+                
+            except (orjson.JSONDecodeError, ijson.JSONError) as e:
+                logger.error(f"Invalid JSON from {url}: {e}")
+                raise ValueError("Failed to parse server response.")
+    
+    async def _single_flight(self, key: Tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fetch once for concurrent callers sharing the same key.
+        
+        The first caller starts the request; callers arriving while it is
+        in flight await the same task instead of issuing their own GET.
+        The task is shielded so one caller's cancellation does not abort
+        the request for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.debug(f"Joining in-flight request for {key}")
+        return await asyncio.shield(task)
+    
+    def _category_paths(self, category_ids: List[int]) -> List[str]:
+        """Map category IDs to the export paths that will be requested."""
+        if 0 in category_ids:
+            if Config.FANOUT_CATEGORIES:
+                # Split "all categories" into the configured categories,
+                # always requested concurrently rather than coalesced
+                return [str(category_id) for category_id in Config.FANOUT_CATEGORIES]
+            # Category 0 already covers every other category
+            return ["0"]
+        if Config.BATCH_CATEGORIES:
+            return ["-".join(str(category_id) for category_id in category_ids)]
+        return [str(category_id) for category_id in category_ids]
+    
+    async def _fetch_category_path(
+        self,
+        category_path: str,
+        start_date: str,
+        end_date: str,
+        limit: int,
+        cache_ttl: Optional[float] = None,
+        query: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch events for a category export path with caching.
+        
+        Args:
+            category_path: Single category ID or dash-joined IDs (e.g. "1-2-3")
+            start_date: ISO format start date
+            end_date: ISO format end date
+            limit: Maximum number of events
+            cache_ttl: Cache lifetime in seconds, also the maximum age of a
+                cached entry this call accepts (default: Config.CACHE_TTL)
+            query: Optional server-side title filter
             
-        except requests.exceptions.ConnectionError:
-            logger.error(f"Connection error for {url}")
-            raise ValueError("Connection failed. Check your network.")
+        Returns:
+            List of event dictionaries ordered by start
+        """
+        key = ("categ", category_path, start_date, end_date, limit, query)
+        if cache_ttl is None:
+            cache_ttl = Config.CACHE_TTL
+        if self._cache_enabled:
+            # Entries are shared between tools; honour this caller's TTL
+            # even if the entry was stored by a tool with a longer one
+            cached = _CACHE.get(key, max_age=cache_ttl)
+            if cached is not None:
+                return cached
+        
+        async def download() -> List[Dict[str, Any]]:
+            url = f"{_EXPORT}/categ/{category_path}.json"
+            params = _events_params(start_date, end_date, limit, query)
             
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                logger.error("Resource not found")
-                raise ValueError("Resource not found.")
-            elif e.response.status_code == 403:
-                logger.error("Access forbidden - resource may not be public")
-                raise ValueError("Access forbidden. This resource may not be public.")
-            else:
-                logger.error(f"HTTP error {e.response.status_code}: {e}")
-                raise ValueError(f"Server error: {e.response.status_code}")
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise ValueError(f"Failed to fetch data: {str(e)}")
+            data = await self._make_request(url, params)
+            events = _prepare_events(data.get("results", []))
+            
+            if self._cache_enabled:
+                _cache_put(key, events, cache_ttl)
+            
+            logger.info(f"Fetched {len(events)} events for category {category_path}, range {start_date} to {end_date}")
+            return events
+        
+        return await self._single_flight(key, download)
     
-    @lru_cache(maxsize=Config.CACHE_SIZE)
-    def fetch_events(
+    async def fetch_events(
         self,
         category_id: int,
         start_date: str,
@@ -87,7 +403,7 @@ class IndicoClient:
         limit: int
     ) -> List[Dict[str, Any]]:
         """
-        Fetch events from Indico API with caching.
+        Fetch events for one category from Indico API with caching.
         
         Args:
             category_id: Category ID (0 for all)
@@ -98,22 +414,130 @@ class IndicoClient:
         Returns:
             List of event dictionaries
         """
-        url = f"{Config.INDICO_EXPORT}/categ/{category_id}.json"
-        params = {
-            "limit": limit,
-            "order": "start",
-            "onlypublic": "yes",
-            "from": start_date,
-            "to": end_date
-        }
+        return await self._fetch_category_path(str(category_id), start_date, end_date, limit)
+    
+    async def fetch_events_many(
+        self,
+        category_ids: List[int],
+        start_date: str,
+        end_date: str,
+        limit: int,
+        cache_ttl: Optional[float] = None,
+        query: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the earliest events across several categories.
         
-        data = self._make_request(url, params)
-        events = data.get("results", [])
+        With Config.BATCH_CATEGORIES enabled, all categories are coalesced
+        into a single export request (``/categ/1-2-3.json``); otherwise one
+        request per category is issued concurrently and the results are
+        merged, de-duplicated by event ID and ordered by start.
         
-        logger.info(f"Fetched {len(events)} events for range {start_date} to {end_date}")
-        return events
+        Args:
+            category_ids: Category IDs to query
+            start_date: ISO format start date
+            end_date: ISO format end date
+            limit: Maximum number of merged events
+            cache_ttl: Cache lifetime in seconds (default: Config.CACHE_TTL)
+            query: Optional server-side title filter
+            
+        Returns:
+            Merged list of event dictionaries
+        """
+        paths = self._category_paths(category_ids)
+        batches = await asyncio.gather(*[
+            self._fetch_category_path(path, start_date, end_date, limit, cache_ttl, query)
+            for path in paths
+        ])
+        if len(batches) == 1:
+            return batches[0]
+        return _merge_batches(batches, limit)
     
-    def fetch_event_details(self, event_id: int) -> Optional[Dict[str, Any]]:
+    async def _search_category_path(
+        self,
+        category_path: str,
+        start_date: str,
+        end_date: str,
+        fetch_limit: int,
+        match: Callable[[bytes], Any],
+        max_results: int,
+        query: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Stream a category export and keep only events whose title matches.
+        
+        Events are parsed one at a time and non-matching ones are dropped
+        immediately, so the full payload is never materialized. Reading
+        stops as soon as max_results matches are found.
+        
+        Args:
+            category_path: Single category ID or dash-joined IDs
+            start_date: ISO format start date
+            end_date: ISO format end date
+            fetch_limit: Maximum number of events scanned
+            match: Predicate applied to the title search key
+            max_results: Stop after this many matches
+            query: Optional server-side title filter
+            
+        Returns:
+            Matching event dictionaries ordered by start
+        """
+        async def collect(response: httpx.Response) -> List[Dict[str, Any]]:
+            matches = []
+            async for event in ijson.items(_ByteStream(response), "results.item", use_float=True):
+                if match(search_key(event.get("title"))):
+                    matches.append(event)
+                    if len(matches) >= max_results:
+                        break
+            return _prepare_events(matches)
+        
+        url = f"{_EXPORT}/categ/{category_path}.json"
+        params = _events_params(start_date, end_date, fetch_limit, query)
+        matches = await self._make_request(url, params, handler=collect)
+        
+        logger.info(f"Streamed {len(matches)} matching events for category {category_path}")
+        return matches
+    
+    async def search_events_many(
+        self,
+        category_ids: List[int],
+        start_date: str,
+        end_date: str,
+        fetch_limit: int,
+        match: Callable[[bytes], Any],
+        max_results: int,
+        query: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search events across categories, filtering while the response is parsed.
+        
+        Uncached counterpart of fetch_events_many followed by a title filter;
+        peak memory is bounded by the matches rather than the whole payload.
+        
+        Args:
+            category_ids: Category IDs to query
+            start_date: ISO format start date
+            end_date: ISO format end date
+            fetch_limit: Maximum number of events scanned per request
+            match: Predicate applied to the title search key
+            max_results: Maximum number of matches returned
+            query: Optional server-side title filter
+            
+        Returns:
+            Matching event dictionaries ordered by start
+        """
+        paths = self._category_paths(category_ids)
+        batches = await asyncio.gather(*[
+            self._search_category_path(
+                path, start_date, end_date, fetch_limit, match, max_results, query
+            )
+            for path in paths
+        ])
+        if len(batches) == 1:
+            return batches[0]
+        return _merge_batches(batches, max_results)
+    
+    async def fetch_event_details(self, event_id: int) -> Optional[Dict[str, Any]]:
         """
         Fetch detailed information for a single event.
         
@@ -123,33 +547,111 @@ class IndicoClient:
         Returns:
             Event dictionary or None if not found
         """
-        url = f"{Config.INDICO_EXPORT}/event/{event_id}.json"
+        key = ("event", event_id)
+        if self._cache_enabled:
+            cached = _CACHE.get(key)
+            if cached is not None:
+                return cached
+        
+        url = f"{_EXPORT}/event/{event_id}.json"
         params = {"onlypublic": "yes", "detail": "events"}
         
-        data = self._make_request(url, params)
+        data = await self._single_flight(key, lambda: self._make_request(url, params))
         results = data.get("results", [])
         
         if not results:
             logger.warning(f"No event found with ID: {event_id}")
             return None
+        
+        if self._cache_enabled:
+            _cache_put(key, results[0], Config.DETAILS_CACHE_TTL)
             
         logger.info(f"Retrieved details for event {event_id}")
         return results[0]
     
+    async def fetch_event_details_many(
+        self,
+        event_ids: List[int]
+    ) -> Dict[int, Union[Optional[Dict[str, Any]], Exception]]:
+        """
+        Fetch details for several events in one dash-joined export request.
+        
+        IDs missing from the bulk response (or all IDs, if the bulk request
+        fails) are retried one by one, so each ID gets the same result or
+        error it would get from fetch_event_details.
+        
+        Args:
+            event_ids: Numeric event IDs
+        
+        Returns:
+            Mapping of event ID to event dictionary, None if not found,
+            or the exception raised for that ID
+        """
+        found: Dict[int, Any] = {}
+        missing = []
+        for event_id in event_ids:
+            cached = _CACHE.get(("event", event_id)) if self._cache_enabled else None
+            if cached is not None:
+                found[event_id] = cached
+            else:
+                missing.append(event_id)
+        
+        if len(missing) > 1:
+            url = f"{_EXPORT}/event/{'-'.join(str(event_id) for event_id in missing)}.json"
+            params = {"onlypublic": "yes", "detail": "events"}
+            try:
+                data = await self._make_request(url, params)
+            except Exception as e:
+                logger.warning(f"Bulk details request failed, fetching individually: {e}")
+                data = {}
+            
+            for event in data.get("results", []):
+                try:
+                    event_id = int(event.get("id"))
+                except (TypeError, ValueError):
+                    continue
+                if event_id in missing and event_id not in found:
+                    found[event_id] = event
+                    if self._cache_enabled:
+                        _cache_put(("event", event_id), event, Config.DETAILS_CACHE_TTL)
+            missing = [event_id for event_id in missing if event_id not in found]
+        
+        if missing:
+            singles = await asyncio.gather(
+                *[self.fetch_event_details(event_id) for event_id in missing],
+                return_exceptions=True
+            )
+            found.update(zip(missing, singles))
+        
+        logger.info(f"Retrieved details for {len(event_ids)} events")
+        return found
+    
     def clear_cache(self):
-        """Clear the LRU cache."""
-        if hasattr(self.fetch_events, 'cache_clear'):
-            self.fetch_events.cache_clear()
-            logger.info("Cache cleared")
+        """Clear the response caches."""
+        _cache_clear()
     
     def get_cache_info(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        if hasattr(self.fetch_events, 'cache_info'):
-            info = self.fetch_events.cache_info()
-            return {
-                "hits": info.hits,
-                "misses": info.misses,
-                "maxsize": info.maxsize,
-                "currsize": info.currsize
-            }
-        return {}
\ No newline at end of file
+        return _cache_info()
+
+
+def _start_sort_key(event: Dict[str, Any]) -> Tuple[str, str]:
+    """Sort key ordering raw Indico events by start date and time."""
+    start = event.get("startDate") or {}
+    return (start.get("date", ""), start.get("time", ""))
+
+
+def _merge_batches(batches: List[List[Dict[str, Any]]], limit: int) -> List[Dict[str, Any]]:
+    """Merge per-category results, de-duplicated by event ID and ordered by start."""
+    seen = set()
+    merged = []
+    for batch in batches:
+        for event in batch:
+            event_id = event.get("id")
+            if event_id in seen:
+                continue
+            seen.add(event_id)
+            merged.append(event)
+    
+    merged.sort(key=_start_sort_key)
+    return merged[:limit]
@@ -4,6 +4,7 @@ Configuration module for Indico MCP Server.
 
 import os
 import logging
+from typing import Any, Callable, List
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -27,11 +28,29 @@ class Config:
     REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "15"))
     MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
     RETRY_BACKOFF = float(os.getenv("RETRY_BACKOFF", "0.3"))
+    RETRY_JITTER = float(os.getenv("RETRY_JITTER", "0.5"))  # Max random seconds added
+    MAX_RETRY_AFTER = float(os.getenv("MAX_RETRY_AFTER", "10"))  # Longer waits fail fast
+    POOL_MAXSIZE = int(os.getenv("POOL_MAXSIZE", "32"))
+    KEEPALIVE_TIMEOUT = int(os.getenv("KEEPALIVE_TIMEOUT", "60"))
     
     # Performance Configuration
     CACHE_SIZE = int(os.getenv("CACHE_SIZE", "128"))
+    CACHE_TTL = int(os.getenv("CACHE_TTL", "300"))  # Seconds, search results
+    UPCOMING_CACHE_TTL = int(os.getenv("UPCOMING_CACHE_TTL", "60"))  # Seconds
+    DETAILS_CACHE_TTL = int(os.getenv("DETAILS_CACHE_TTL", "3600"))  # Seconds
+    EMPTY_CACHE_TTL = int(os.getenv("EMPTY_CACHE_TTL", "30"))  # Seconds, empty results
+    NEGATIVE_CACHE_TTL = int(os.getenv("NEGATIVE_CACHE_TTL", "60"))  # Seconds, 403/404
     FETCH_MULTIPLIER = 10  # Fetch 10x requested for filtering
     MIN_FETCH_LIMIT = 100
+    HIT_RATE_ALPHA = 0.3  # EMA weight of each search in keyword hit rates
+    MIN_HIT_RATE = 0.05  # Caps adaptive overfetch at 20x requested
+    MAX_CATEGORIES = 20  # Max categories queried concurrently per call
+    MAX_KEYWORDS = 20  # Max alternative keywords per search
+    MAX_INLINE_BYTES = int(os.getenv("MAX_INLINE_BYTES", "65536"))  # Larger details spill to disk; 0 disables
+    # Must be a directory owned by this user and not writable by others
+    SPILL_DIR = os.path.expanduser(os.getenv("SPILL_DIR", "~/.cache/indico-mcp/details"))
+    BATCH_INTERVAL_MS = float(os.getenv("BATCH_INTERVAL_MS", "10"))  # Details batching window
+    MAX_BATCH = int(os.getenv("MAX_BATCH", "10"))  # Max event IDs per details request
     
     # Logging Configuration
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -40,6 +59,47 @@ class Config:
     # Feature Flags
     ENABLE_CACHE = os.getenv("ENABLE_CACHE", "true").lower() == "true"
     DEBUG_MODE = os.getenv("DEBUG_MODE", "false").lower() == "true"
+    # Skip integer type checks already done by FastMCP's argument coercion;
+    # direct callers bypassing FastMCP then get TypeErrors, not ValueErrors
+    TRUST_MCP_TYPES = os.getenv("TRUST_MCP_TYPES", "false").lower() == "true"
+    ENABLE_BATCHING = os.getenv("ENABLE_BATCHING", "false").lower() == "true"
+    INDICO_SUPPORTS_Q = os.getenv("INDICO_SUPPORTS_Q", "false").lower() == "true"
+    BATCH_CATEGORIES = os.getenv("BATCH_CATEGORIES", "true").lower() == "true"
+    FANOUT_CATEGORIES = [
+        int(category_id) for category_id in os.getenv("FANOUT_CATEGORIES", "").split(",")
+        if category_id.strip()
+    ]
+    
+    # Callbacks run by reload() so modules can rebind cached values
+    _reload_hooks: List[Callable[[], None]] = []
+    
+    @classmethod
+    def add_reload_hook(cls, hook: Callable[[], None]):
+        """Register a callback to run after reload()."""
+        cls._reload_hooks.append(hook)
+    
+    @classmethod
+    def reload(cls, **overrides: Any):
+        """
+        Update settings at runtime and rebind module-level copies.
+        
+        Hot paths read Config values from module constants bound at import;
+        registered hooks rebind them so the new values take effect.
+        
+        Args:
+            **overrides: Setting names and their new values
+            
+        Raises:
+            ValueError: If a name is not a known setting
+        """
+        for name, value in overrides.items():
+            if not name.isupper() or not hasattr(cls, name):
+                raise ValueError(f"Unknown setting: {name}")
+            setattr(cls, name, value)
+        if "INDICO_BASE_URL" in overrides and "INDICO_EXPORT" not in overrides:
+            cls.INDICO_EXPORT = f"{cls.INDICO_BASE_URL}/export"
+        for hook in cls._reload_hooks:
+            hook()
     
     @classmethod
     def is_authenticated(cls) -> bool:
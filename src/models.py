@@ -2,12 +2,18 @@
 Data models and normalization for Indico events.
 """
 
-from typing import Dict, Any, Optional
+import sys
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 
+# __slots__ dataclasses need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class Event:
     """Normalized event data model."""
     id: str
@@ -37,8 +43,30 @@ class Event:
         return result
 
 
+@lru_cache(maxsize=4096)
+def _format_parts(date: str, time: str, tz: str) -> str:
+    """Format date, time and timezone; memoized since agendas share slots."""
+    # Format based on available information
+    if time:
+        return f"{date} {time} ({tz})"
+    return f"{date} ({tz})"
+
+
 class EventNormalizer:
-    """Handles event data transformation and normalization."""
+    """
+    Handles event data transformation and normalization.
+    
+    normalize_list keeps an LRU of normalized events keyed by event ID
+    and modification stamp, so events served again from the response
+    cache are not re-normalized on every call.
+    """
+    
+    def __init__(self, cache_size: int = 1024):
+        self._cache_size = cache_size
+        # (id, stamp, include_description) -> (raw event, normalized dict)
+        self._cache: "OrderedDict[Tuple, Tuple[Dict[str, Any], Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
     
     @staticmethod
     def normalize(event_data: Dict[str, Any], include_description: bool = False) -> Optional[Event]:
@@ -56,26 +84,75 @@ class EventNormalizer:
             return None
         
         try:
-            # Extract dates
-            start_date = event_data.get("startDate", {})
-            end_date = event_data.get("endDate", {})
+            # Bind the lookup once; every field is a single dict probe
+            get = event_data.get
+            format_datetime = EventNormalizer._format_datetime
+            
+            # Fall back to categoryTitle only when category is absent
+            category = get("category")
+            if category is None:
+                category = get("categoryTitle", "")
             
-            # Create Event object
-            event = Event(
-                id=str(event_data.get("id", "")),
-                title=event_data.get("title", ""),
-                category=event_data.get("category", event_data.get("categoryTitle", "")),
-                start=EventNormalizer._format_datetime(start_date),
-                end=EventNormalizer._format_datetime(end_date),
-                location=event_data.get("roomFullname") or event_data.get("location") or "N/A",
-                type=event_data.get("type", ""),
-                url=event_data.get("url", "")
+            return Event(
+                str(get("id", "")),
+                get("title", ""),
+                category,
+                format_datetime(get("startDate", {})),
+                format_datetime(get("endDate", {})),
+                get("roomFullname") or get("location") or "N/A",
+                get("type", ""),
+                get("url", ""),
+                get("description", "") if include_description else None
             )
             
-            if include_description:
-                event.description = event_data.get("description", "")
+        except (KeyError, TypeError) as e:
+            logger.error(f"Failed to normalize event: {e}")
+            return None
+    
+    @staticmethod
+    def normalize_to_dict(
+        event_data: Dict[str, Any],
+        include_description: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Convert raw Indico event straight to its dictionary representation.
+        
+        Produces the same result as ``normalize(...).to_dict()`` without
+        allocating the intermediate Event object.
+        
+        Args:
+            event_data: Raw event dictionary from Indico API
+            include_description: Whether to include description field
             
-            return event
+        Returns:
+            Normalized event dictionary or None if invalid
+        """
+        if not event_data:
+            return None
+        
+        try:
+            get = event_data.get
+            format_datetime = EventNormalizer._format_datetime
+            
+            category = get("category")
+            if category is None:
+                category = get("categoryTitle", "")
+            
+            result = {
+                "id": str(get("id", "")),
+                "title": get("title", ""),
+                "category": category,
+                "start": format_datetime(get("startDate", {})),
+                "end": format_datetime(get("endDate", {})),
+                "location": get("roomFullname") or get("location") or "N/A",
+                "type": get("type", ""),
+                "url": get("url", "")
+            }
+            if include_description:
+                description = get("description", "")
+                if description is not None:
+                    result["description"] = description
+            return result
             
         except (KeyError, TypeError) as e:
             logger.error(f"Failed to normalize event: {e}")
@@ -99,16 +176,50 @@ class EventNormalizer:
         if not date:
             return None
             
-        time = dt_dict.get("time", "")
-        tz = dt_dict.get("tz", "Europe/Zurich")
+        return _format_parts(date, dt_dict.get("time", ""), dt_dict.get("tz", "Europe/Zurich"))
+    
+    def normalize_cached(
+        self,
+        event_data: Dict[str, Any],
+        include_description: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Normalize an event to a dictionary, reusing a previous result.
+        
+        An entry is reused when the event carries the same modification
+        stamp, or, for events without one, when it is the very same raw
+        dictionary (i.e. it came from the response cache).
+        
+        Args:
+            event_data: Raw event dictionary from Indico API
+            include_description: Whether to include description field
+            
+        Returns:
+            Normalized event dictionary or None if invalid
+        """
+        if not event_data:
+            return None
+        
+        get = event_data.get
+        stamp = get("modDt") or get("modificationDate")
+        key = (get("id"), str(stamp) if stamp else None, include_description)
+        cache = self._cache
+        entry = cache.get(key)
+        if entry is not None and (stamp or entry[0] is event_data):
+            cache.move_to_end(key)
+            self.hits += 1
+            return entry[1]
         
-        # Format based on available information
-        if time:
-            return f"{date} {time} ({tz})"
-        return f"{date} ({tz})"
+        self.misses += 1
+        result = EventNormalizer.normalize_to_dict(event_data, include_description)
+        if result is not None:
+            cache[key] = (event_data, result)
+            cache.move_to_end(key)
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
+        return result
     
-    @staticmethod
-    def normalize_list(events: list, include_description: bool = False) -> list:
+    def normalize_list(self, events: list, include_description: bool = False) -> list:
         """
         Normalize a list of events.
         
@@ -119,12 +230,27 @@ class EventNormalizer:
         Returns:
             List of Event dictionaries
         """
-        normalized = []
-        for event_data in events:
-            event = EventNormalizer.normalize(event_data, include_description)
-            if event:
-                normalized.append(event.to_dict())
-        return normalized
+        normalize = self.normalize_cached
+        return [
+            event
+            for event in (normalize(event_data, include_description) for event_data in events)
+            if event
+        ]
+    
+    def clear_cache(self):
+        """Drop all normalized events and reset statistics."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def get_cache_info(self) -> Dict[str, Any]:
+        """Get normalization cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self._cache_size,
+            "currsize": len(self._cache)
+        }
 
 
 # Import logger after defining classes to avoid circular import
@@ -9,43 +9,88 @@ Usage:
 
 Environment Variables:
     LOG_LEVEL - Logging level (DEBUG, INFO, WARNING, ERROR)
-    CACHE_SIZE - LRU cache size for API responses
+    CACHE_SIZE - Max entries in the TTL response cache (oldest evicted first)
     ENABLE_CACHE - Enable/disable caching (true/false)
 
 Note: This server only accesses PUBLIC events for security purposes.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, List, Dict, Any, Optional, Union
 
+import orjson
 from mcp.server.fastmcp import FastMCP
 
 from src.config import Config
-from src.client import IndicoClient
+from src.batcher import AsyncBatcher
+from src.client import AsyncIndicoClient
 from src.models import EventNormalizer
+from src.spill import read_spill, write_spill
+from src.stats import KeywordHitRate
 from src.utils import (
-    DateRange, 
+    calculate_date_range,
     validate_limit, 
     validate_event_id, 
-    validate_category_id,
-    sanitize_keyword,
+    validate_category_ids,
+    sanitize_keywords,
+    keyword_matcher,
     calculate_fetch_limit
 )
 
 # Setup
 logger = logging.getLogger(__name__)
-app = FastMCP("indico")
 
-# Initialize components
-client = IndicoClient()
-normalizer = EventNormalizer()
+# Components are created on first use, so importing this module has no
+# side effects and startup does not pay for objects a run never needs
+@lru_cache(maxsize=None)
+def _client() -> AsyncIndicoClient:
+    """Shared Indico client."""
+    return AsyncIndicoClient()
+
+
+@lru_cache(maxsize=None)
+def _normalizer() -> EventNormalizer:
+    """Shared event normalizer."""
+    return EventNormalizer()
+
+
+@lru_cache(maxsize=None)
+def _keyword_stats() -> KeywordHitRate:
+    """Shared keyword hit-rate tracker."""
+    return KeywordHitRate(alpha=Config.HIT_RATE_ALPHA)
+
+
+@lru_cache(maxsize=None)
+def _details_batcher() -> AsyncBatcher:
+    """Shared batcher for event detail lookups."""
+    return AsyncBatcher(
+        _client().fetch_event_details_many,
+        interval_ms=Config.BATCH_INTERVAL_MS,
+        max_size=Config.MAX_BATCH
+    )
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared HTTP session when the server shuts down."""
+    try:
+        yield
+    finally:
+        if _client.cache_info().currsize:
+            await _client().close()
+
+
+app = FastMCP("indico", lifespan=lifespan)
 
 
 @app.tool()
-def search_events(
-    keyword: str,
+async def search_events(
+    keyword: Union[str, List[str]],
     limit: int = Config.DEFAULT_LIMIT,
-    category_id: int = 0,
+    category_id: Union[int, List[int]] = 0,
     days_ahead: Optional[int] = None,
     from_date: Optional[str] = None,
     to_date: Optional[str] = None
@@ -54,12 +99,16 @@ def search_events(
     Search upcoming public CERN Indico events by keyword.
     
     Searches event titles for the specified keyword within the given date range.
+    When several keywords are given, events matching any of them are returned.
     Uses intelligent filtering to find relevant events efficiently.
     
     Args:
-        keyword: Text to search for in event titles (case-insensitive)
+        keyword: Text or list of texts to search for in event titles
+            (case-insensitive)
         limit: Maximum number of results (1-500, default 10)
-        category_id: Indico category ID (0 for all categories, default 0)
+        category_id: Indico category ID or list of IDs (0 for all, default 0);
+            a list is fetched as one combined export request, or one
+            concurrent request per category when batching is disabled
         days_ahead: Days to look ahead (overrides default 30)
         from_date: Start date YYYY-MM-DD (default: today)
         to_date: End date YYYY-MM-DD (overrides days_ahead)
@@ -73,36 +122,60 @@ def search_events(
     Examples:
         search_events("machine learning", limit=5)
         search_events("physics", days_ahead=14, category_id=123)
+        search_events("workshop", category_id=[123, 456])
+        search_events(["higgs", "top quark"], limit=20)
         search_events("seminar", from_date="2025-01-01", to_date="2025-01-31")
     """
     try:
         # Validate and sanitize inputs
-        keyword = sanitize_keyword(keyword)
+        keywords = sanitize_keywords(keyword)
         limit = validate_limit(limit)
-        category_id = validate_category_id(category_id)
+        category_ids = validate_category_ids(category_id)
         
         # Calculate date range
-        date_range = DateRange(default_days=30)
-        start, end = date_range.calculate(from_date, to_date, days_ahead)
-        
-        # Calculate fetch limit for filtering
-        fetch_limit = calculate_fetch_limit(limit)
-        
-        # Fetch events from API
-        events = client.fetch_events(category_id, start, end, fetch_limit)
+        start, end = calculate_date_range(from_date, to_date, days_ahead, default_days=30)
+        
+        # Let the server filter by title when supported; no overfetch needed
+        query = keywords[0] if Config.INDICO_SUPPORTS_Q and len(keywords) == 1 else None
+        
+        # Calculate fetch limit for filtering, sized by past hit rates
+        stats = _keyword_stats()
+        fetch_limit = limit if query else calculate_fetch_limit(limit, stats.get(keywords))
+        
+        match = keyword_matcher(keywords)
+        
+        if not Config.ENABLE_CACHE:
+            # Nothing to reuse later: filter while parsing, stop at limit
+            limited_events = await _client().search_events_many(
+                category_ids, start, end, fetch_limit, match, limit, query=query
+            )
+            results = _normalizer().normalize_list(limited_events)
+            logger.info(f"Search {keywords} found {len(results)} matches (streamed)")
+            return results
+        
+        # Fetch events from API (one combined request, or one per category)
+        events = await _client().fetch_events_many(
+            category_ids, start, end, fetch_limit, query=query
+        )
+        
+        # Filter by keywords (case-insensitive, search keys built at fetch time),
+        # stopping as soon as limit matches are found
+        limited_events = []
+        scanned = 0
+        for event in events:
+            scanned += 1
+            if match(event["_title_key"]):
+                limited_events.append(event)
+                if len(limited_events) >= limit:
+                    break
+        
+        if not query:
+            stats.record(keywords, len(limited_events), scanned)
         
-        # Filter by keyword (case-insensitive)
-        keyword_lower = keyword.lower()
-        filtered = [
-            event for event in events 
-            if keyword_lower in event.get("title", "").lower()
-        ]
-        
-        # Limit and normalize results
-        limited_events = filtered[:limit]
-        results = normalizer.normalize_list(limited_events)
+        # Normalize results
+        results = _normalizer().normalize_list(limited_events)
         
-        logger.info(f"Search '{keyword}' found {len(results)} matches out of {len(events)} events")
+        logger.info(f"Search {keywords} found {len(results)} matches out of {len(events)} events")
         return results
         
     except Exception as e:
@@ -111,7 +184,7 @@ def search_events(
 
 
 @app.tool()
-def get_event_details(event_id: int) -> Dict[str, Any]:
+async def get_event_details(event_id: int) -> Dict[str, Any]:
     """
     Get detailed information for a specific public Indico event.
     
@@ -122,7 +195,9 @@ def get_event_details(event_id: int) -> Dict[str, Any]:
         event_id: Numeric Indico event ID (must be positive)
         
     Returns:
-        Detailed event information with description field
+        Detailed event information with description field, or for
+        events larger than MAX_INLINE_BYTES a reference with title,
+        summary and detail_path to load via fetch_cached_detail
         
     Raises:
         ValueError: If event_id is invalid or event not found
@@ -134,32 +209,96 @@ def get_event_details(event_id: int) -> Dict[str, Any]:
         # Validate input
         event_id = validate_event_id(event_id)
         
-        # Fetch event details
-        event_data = client.fetch_event_details(event_id)
+        # Fetch event details, coalescing back-to-back lookups when enabled
+        if Config.ENABLE_BATCHING:
+            event_data = await _details_batcher().submit(event_id)
+        else:
+            event_data = await _client().fetch_event_details(event_id)
         
         if not event_data:
             return {"error": f"No public event found with ID {event_id}"}
         
         # Normalize with description
-        event = normalizer.normalize(event_data, include_description=True)
+        result = _normalizer().normalize_to_dict(event_data, include_description=True)
         
-        if not event:
+        if not result:
             return {"error": f"Failed to process event data for ID {event_id}"}
         
-        result = event.to_dict()
-        logger.info(f"Retrieved details for event {event_id}: '{event.title}'")
-        return result
+        logger.info(f"Retrieved details for event {event_id}: '{result['title']}'")
+        return await _spill_detail(event_id, result)
         
     except Exception as e:
         logger.error(f"Failed to get event {event_id}: {e}")
         raise
 
 
+async def _spill_detail(event_id: int, result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Write oversized event details to disk and return a reference instead.
+    
+    The directory checks, expiry sweep and file write run in the default
+    executor so they never block other tool calls on the event loop.
+    
+    Args:
+        event_id: Numeric event ID
+        result: Normalized event dictionary
+        
+    Returns:
+        The event itself if small enough (or if the spill directory is
+        unusable), otherwise a reference to the file
+    """
+    if Config.MAX_INLINE_BYTES <= 0:
+        return result
+    
+    payload = orjson.dumps(result)
+    if len(payload) <= Config.MAX_INLINE_BYTES:
+        return result
+    
+    try:
+        loop = asyncio.get_running_loop()
+        path = await loop.run_in_executor(None, write_spill, str(event_id), payload)
+    except (OSError, ValueError) as e:
+        logger.error(f"Cannot spill details for event {event_id}, returning inline: {e}")
+        return result
+    
+    logger.info(f"Spilled {len(payload)} byte details for event {event_id} to {path}")
+    return {
+        "event_id": event_id,
+        "title": result.get("title", ""),
+        "summary": (result.get("description") or "")[:500],
+        "detail_path": path,
+        "size": len(payload)
+    }
+
+
+@app.tool()
+async def fetch_cached_detail(detail_path: str) -> Dict[str, Any]:
+    """
+    Load full event details previously spilled by get_event_details.
+    
+    Args:
+        detail_path: detail_path returned by get_event_details
+        
+    Returns:
+        Detailed event information with description field
+        
+    Raises:
+        ValueError: If the path is outside the spill directory, missing
+            or expired
+        
+    Examples:
+        fetch_cached_detail("/home/user/.cache/indico-mcp/details/1234567.json")
+    """
+    # File access runs off the event loop, like the spill write
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, read_spill, detail_path)
+
+
 @app.tool()
-def upcoming_public(
+async def upcoming_public(
     days: Optional[int] = None,
     limit: int = Config.DEFAULT_LIMIT,
-    category_id: int = 0,
+    category_id: Union[int, List[int]] = 0,
     from_date: Optional[str] = None,
     to_date: Optional[str] = None
 ) -> List[Dict[str, Any]]:
@@ -172,7 +311,9 @@ def upcoming_public(
     Args:
         days: Days to look ahead (default 7)
         limit: Maximum events to return (1-500, default 10)
-        category_id: Indico category ID (0 for all, default 0)
+        category_id: Indico category ID or list of IDs (0 for all, default 0);
+            a list is fetched as one combined export request, or one
+            concurrent request per category when batching is disabled
         from_date: Start date YYYY-MM-DD (default: today)
         to_date: End date YYYY-MM-DD (overrides days)
         
@@ -186,21 +327,23 @@ def upcoming_public(
         upcoming_public()  # Next 7 days
         upcoming_public(days=14, limit=20)  # Next 2 weeks, 20 events
         upcoming_public(from_date="2025-01-01", to_date="2025-01-07")
+        upcoming_public(category_id=[123, 456])
     """
     try:
         # Validate inputs
         limit = validate_limit(limit)
-        category_id = validate_category_id(category_id)
+        category_ids = validate_category_ids(category_id)
         
         # Calculate date range
-        date_range = DateRange(default_days=7)
-        start, end = date_range.calculate(from_date, to_date, days)
+        start, end = calculate_date_range(from_date, to_date, days, default_days=7)
         
-        # Fetch events
-        events = client.fetch_events(category_id, start, end, limit)
+        # Fetch events (one combined request, or one per category)
+        events = await _client().fetch_events_many(
+            category_ids, start, end, limit, cache_ttl=Config.UPCOMING_CACHE_TTL
+        )
         
         # Normalize results
-        results = normalizer.normalize_list(events)
+        results = _normalizer().normalize_list(events[:limit])
         
         logger.info(f"Listed {len(results)} upcoming events from {start} to {end}")
         return results
@@ -211,14 +354,25 @@ def upcoming_public(
 
 
 @app.tool()
-def server_status() -> Dict[str, Any]:
+def server_status(clear_cache: bool = False) -> Dict[str, Any]:
     """
     Get server status and configuration information.
     
+    Args:
+        clear_cache: Drop cached responses and normalized events first
+        
     Returns:
         Server status including authentication, cache stats, and configuration
+        
+    Examples:
+        server_status()
+        server_status(clear_cache=True)
     """
     try:
+        if clear_cache:
+            _client().clear_cache()
+            _normalizer().clear_cache()
+        
         status = {
             "version": "2.0.0",
             "public_only": True,
@@ -229,9 +383,10 @@ def server_status() -> Dict[str, Any]:
         }
         
         # Add cache statistics if available
-        cache_info = client.get_cache_info()
+        cache_info = _client().get_cache_info()
         if cache_info:
             status["cache_stats"] = cache_info
+        status["normalizer_cache"] = _normalizer().get_cache_info()
             
         logger.info("Server status requested")
         return status
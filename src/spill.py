@@ -0,0 +1,131 @@
+"""
+On-disk store for event details too large to return inline.
+"""
+
+import logging
+import os
+import stat
+import tempfile
+import time
+from typing import Any, Dict
+
+import orjson
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def spill_dir() -> str:
+    """
+    Return the spill directory, creating it private to the current user.
+    
+    Returns:
+        Path of the spill directory
+    
+    Raises:
+        ValueError: If the path is a symlink or not a directory, or (on
+            POSIX) is not owned by the current user or is writable by
+            other users
+    """
+    path = Config.SPILL_DIR
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        raise ValueError(f"SPILL_DIR {path} is not a real directory")
+    # Ownership and permission bits are only meaningful on POSIX
+    if hasattr(os, "getuid"):
+        if st.st_uid != os.getuid():
+            raise ValueError(f"SPILL_DIR {path} is not owned by the current user")
+        if st.st_mode & 0o022:
+            raise ValueError(f"SPILL_DIR {path} is writable by other users")
+    return path
+
+
+def sweep_expired(directory: str, max_age: float):
+    """
+    Delete spilled (and leftover temporary) files older than max_age.
+    
+    Args:
+        directory: Spill directory
+        max_age: Maximum file age in seconds
+    """
+    cutoff = time.time() - max_age
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if (entry.is_file(follow_symlinks=False)
+                        and entry.stat(follow_symlinks=False).st_mtime < cutoff):
+                    os.unlink(entry.path)
+                    logger.debug(f"Removed expired spill file {entry.path}")
+            except OSError:
+                # Removed concurrently; nothing to clean up
+                continue
+
+
+def write_spill(name: str, payload: bytes) -> str:
+    """
+    Store a payload as <name>.json in the spill directory.
+    
+    The payload is written to a fresh mkstemp file and renamed into
+    place, so readers never see a partial file and no predictable path
+    is ever opened for writing. Expired files are swept first.
+    
+    Args:
+        name: File name without extension (e.g. the event ID)
+        payload: Serialized JSON
+    
+    Returns:
+        Path of the stored file
+    
+    Raises:
+        ValueError: If the spill directory is unsafe to use
+        OSError: If the file cannot be written
+    """
+    directory = spill_dir()
+    sweep_expired(directory, Config.DETAILS_CACHE_TTL)
+    
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        path = os.path.join(directory, f"{name}.json")
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return path
+
+
+def read_spill(detail_path: str) -> Dict[str, Any]:
+    """
+    Load a payload previously stored by write_spill.
+    
+    Args:
+        detail_path: Path returned by write_spill
+    
+    Returns:
+        Parsed JSON payload
+    
+    Raises:
+        ValueError: If the path is outside the spill directory, missing
+            or older than DETAILS_CACHE_TTL
+    """
+    directory = os.path.realpath(spill_dir())
+    path = os.path.realpath(detail_path)
+    if os.path.dirname(path) != directory or not path.endswith(".json"):
+        raise ValueError("detail_path must be a path returned by get_event_details")
+    
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except FileNotFoundError:
+        raise ValueError(f"No cached details at {detail_path}; call get_event_details again")
+    
+    with os.fdopen(fd, "rb") as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode) or time.time() - st.st_mtime > Config.DETAILS_CACHE_TTL:
+            raise ValueError(f"Cached details at {detail_path} expired; call get_event_details again")
+        return orjson.loads(f.read())
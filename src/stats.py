@@ -0,0 +1,59 @@
+"""
+Search statistics used to size keyword fetches.
+"""
+
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+
+class KeywordHitRate:
+    """
+    Exponentially weighted share of scanned events matching a search.
+    
+    Each search records how many of the events it scanned matched; the
+    rate for a keyword set is an EMA over searches, so it follows agendas
+    as they change. Keys are the case-folded, sorted keywords. At most
+    maxsize keyword sets are tracked, dropping the least recently updated.
+    """
+    
+    def __init__(self, alpha: float = 0.3, maxsize: int = 1024):
+        self.alpha = alpha
+        self.maxsize = maxsize
+        self._rates: "OrderedDict[Tuple[str, ...], float]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._rates)
+    
+    @staticmethod
+    def _key(keywords: List[str]) -> Tuple[str, ...]:
+        return tuple(sorted({keyword.casefold() for keyword in keywords}))
+    
+    def get(self, keywords: List[str]) -> Optional[float]:
+        """
+        Look up the observed hit rate for a keyword set.
+        
+        Args:
+            keywords: Sanitized keywords
+        
+        Returns:
+            Hit rate between 0 and 1, or None if never recorded
+        """
+        return self._rates.get(self._key(keywords))
+    
+    def record(self, keywords: List[str], matches: int, total: int):
+        """
+        Fold one search outcome into the keyword set's rate.
+        
+        Args:
+            keywords: Sanitized keywords
+            matches: Number of matching events found
+            total: Number of events scanned to find them
+        """
+        if total <= 0:
+            return
+        key = self._key(keywords)
+        sample = matches / total
+        rate = self._rates.pop(key, None)
+        self._rates[key] = sample if rate is None else rate + self.alpha * (sample - rate)
+        while len(self._rates) > self.maxsize:
+            self._rates.popitem(last=False)
@@ -3,74 +3,150 @@ Utility functions for Indico MCP Server.
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, Tuple
+import math
+import re
+import time
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
 
-class DateRange:
-    """Date range handler with validation."""
-    
-    def __init__(self, default_days: int = Config.DEFAULT_DAYS_AHEAD):
-        self.default_days = default_days
-    
-    def calculate(
-        self, 
-        from_date: Optional[str] = None,
-        to_date: Optional[str] = None,
-        days: Optional[int] = None
-    ) -> Tuple[str, str]:
-        """
-        Calculate and validate date range.
-        
-        Args:
-            from_date: Start date in YYYY-MM-DD format
-            to_date: End date in YYYY-MM-DD format  
-            days: Number of days from start date
-            
-        Returns:
-            Tuple of (start_date, end_date) in ISO format
-            
-        Raises:
-            ValueError: If dates are invalid or range is invalid
-        """
-        # Parse start date
-        if from_date:
-            try:
-                start = datetime.strptime(from_date, "%Y-%m-%d").date()
-            except ValueError:
-                raise ValueError(f"Invalid from_date format: {from_date}. Use YYYY-MM-DD")
-        else:
-            start = datetime.now().date()
-        
-        # Parse end date
-        if to_date:
-            try:
-                end = datetime.strptime(to_date, "%Y-%m-%d").date()
-            except ValueError:
-                raise ValueError(f"Invalid to_date format: {to_date}. Use YYYY-MM-DD")
-        elif days is not None:
-            if days < 0:
-                raise ValueError(f"days must be positive, got {days}")
-            if days > 365:
-                raise ValueError(f"days cannot exceed 365, got {days}")
-            end = start + timedelta(days=days)
-        else:
-            end = start + timedelta(days=self.default_days)
-        
-        # Validate range
-        if end < start:
-            raise ValueError(f"End date {end} is before start date {start}")
-        
-        days_diff = (end - start).days
-        if days_diff > 365:
-            raise ValueError(f"Date range cannot exceed 365 days, got {days_diff} days")
-        
-        logger.debug(f"Date range calculated: {start} to {end}")
-        return start.isoformat(), end.isoformat()
+def _bind_config():
+    """Bind Config values read on every call; rerun by Config.reload()."""
+    global _MAX_LIMIT, _MAX_CATEGORIES, _MAX_KEYWORDS, _FETCH_MULTIPLIER, _MIN_FETCH_LIMIT
+    global _MIN_HIT_RATE, _TRUST_TYPES
+    _MAX_LIMIT = Config.MAX_LIMIT
+    _MAX_CATEGORIES = Config.MAX_CATEGORIES
+    _MAX_KEYWORDS = Config.MAX_KEYWORDS
+    _FETCH_MULTIPLIER = Config.FETCH_MULTIPLIER
+    _MIN_FETCH_LIMIT = Config.MIN_FETCH_LIMIT
+    _MIN_HIT_RATE = Config.MIN_HIT_RATE
+    _TRUST_TYPES = Config.TRUST_MCP_TYPES
+
+
+_bind_config()
+Config.add_reload_hook(_bind_config)
+
+
+@lru_cache(maxsize=1)
+def _today_at(tick: int) -> date:
+    """Return today's date; memoized per one-second tick."""
+    return date.today()
+
+
+def today() -> date:
+    """Current local date, refreshed at most once per second."""
+    return _today_at(int(time.monotonic()))
+
+
+def _parse_iso_date(value: str) -> date:
+    """
+    Parse a strict YYYY-MM-DD date.
+    
+    date.fromisoformat also accepts compact and week-date forms on newer
+    Pythons, so the shape is checked first to keep the documented format.
+    
+    Raises:
+        ValueError: If the value is not a valid YYYY-MM-DD date
+    """
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        raise ValueError(f"Not a YYYY-MM-DD date: {value}")
+    return date.fromisoformat(value)
+
+
+def calculate_date_range(
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    days: Optional[int] = None,
+    default_days: int = Config.DEFAULT_DAYS_AHEAD
+) -> Tuple[str, str]:
+    """
+    Calculate and validate date range.
+    
+    Args:
+        from_date: Start date in YYYY-MM-DD format
+        to_date: End date in YYYY-MM-DD format  
+        days: Number of days from start date
+        default_days: Range length when neither to_date nor days is given
+        
+    Returns:
+        Tuple of (start_date, end_date) in ISO format
+        
+    Raises:
+        ValueError: If dates are invalid or range is invalid
+    """
+    # Parse start date
+    if from_date:
+        try:
+            start = _parse_iso_date(from_date)
+        except ValueError:
+            raise ValueError(f"Invalid from_date format: {from_date}. Use YYYY-MM-DD")
+    else:
+        start = today()
+    
+    # Parse end date
+    if to_date:
+        try:
+            end = _parse_iso_date(to_date)
+        except ValueError:
+            raise ValueError(f"Invalid to_date format: {to_date}. Use YYYY-MM-DD")
+    elif days is not None:
+        if days < 0:
+            raise ValueError(f"days must be positive, got {days}")
+        if days > 365:
+            raise ValueError(f"days cannot exceed 365, got {days}")
+        end = start + timedelta(days=days)
+    else:
+        end = start + timedelta(days=default_days)
+    
+    # Validate range
+    if end < start:
+        raise ValueError(f"End date {end} is before start date {start}")
+    
+    days_diff = (end - start).days
+    if days_diff > 365:
+        raise ValueError(f"Date range cannot exceed 365 days, got {days_diff} days")
+    
+    logger.debug(f"Date range calculated: {start} to {end}")
+    return start.isoformat(), end.isoformat()
+
+
+def _check_int(value: Any, name: str, lo: int, hi: Optional[int] = None) -> int:
+    """
+    Check that value is an int of at least lo, clamping it to hi.
+    
+    MCP arguments arrive as JSON, so an exact type check is sufficient
+    (and also rejects bools). With Config.TRUST_MCP_TYPES the type check
+    is skipped, relying on FastMCP's coercion against the tool signature;
+    the bounds are always enforced.
+    
+    Args:
+        value: Value to check
+        name: Parameter name used in error messages
+        lo: Minimum allowed value
+        hi: Optional maximum; larger values are clamped to it
+        
+    Returns:
+        Valid value within constraints
+        
+    Raises:
+        ValueError: If value is not an int or is below lo
+    """
+    if not _TRUST_TYPES and type(value) is not int:
+        raise ValueError(f"{name} must be an integer, got {type(value).__name__}")
+        
+    if value < lo:
+        raise ValueError(f"{name} must be at least {lo}, got {value}")
+        
+    if hi is not None and value > hi:
+        logger.warning(f"{name} {value} exceeds maximum {hi}, using maximum")
+        return hi
+        
+    return value
 
 
 def validate_limit(limit: int) -> int:
@@ -86,17 +162,7 @@ def validate_limit(limit: int) -> int:
     Raises:
         ValueError: If limit is invalid
     """
-    if not isinstance(limit, int):
-        raise ValueError(f"Limit must be an integer, got {type(limit).__name__}")
-        
-    if limit < 1:
-        raise ValueError(f"Limit must be at least 1, got {limit}")
-        
-    if limit > Config.MAX_LIMIT:
-        logger.warning(f"Limit {limit} exceeds maximum {Config.MAX_LIMIT}, using maximum")
-        return Config.MAX_LIMIT
-        
-    return limit
+    return _check_int(limit, "Limit", 1, _MAX_LIMIT)
 
 
 def validate_category_id(category_id: int) -> int:
@@ -112,13 +178,39 @@ def validate_category_id(category_id: int) -> int:
     Raises:
         ValueError: If category ID is invalid
     """
-    if not isinstance(category_id, int):
-        raise ValueError(f"Category ID must be an integer, got {type(category_id).__name__}")
+    return _check_int(category_id, "Category ID", 0)
+
+
+def validate_category_ids(category_ids: Union[int, List[int]]) -> List[int]:
+    """
+    Validate one or more category IDs.
+    
+    Args:
+        category_ids: Single category ID or list of category IDs
+        
+    Returns:
+        List of unique, valid category IDs in request order
+        
+    Raises:
+        ValueError: If any category ID is invalid or too many are given
+    """
+    if type(category_ids) is int:
+        return [_check_int(category_ids, "Category ID", 0)]
+        
+    if not isinstance(category_ids, list) or not category_ids:
+        raise ValueError("Category IDs must be an integer or a non-empty list of integers")
         
-    if category_id < 0:
-        raise ValueError(f"Category ID must be non-negative, got {category_id}")
+    if len(category_ids) > _MAX_CATEGORIES:
+        raise ValueError(
+            f"Too many categories (max {_MAX_CATEGORIES}), got {len(category_ids)}"
+        )
         
-    return category_id
+    unique_ids = []
+    for category_id in category_ids:
+        category_id = _check_int(category_id, "Category ID", 0)
+        if category_id not in unique_ids:
+            unique_ids.append(category_id)
+    return unique_ids
 
 
 def validate_event_id(event_id: int) -> int:
@@ -134,13 +226,7 @@ def validate_event_id(event_id: int) -> int:
     Raises:
         ValueError: If event ID is invalid
     """
-    if not isinstance(event_id, int):
-        raise ValueError(f"Event ID must be an integer, got {type(event_id).__name__}")
-        
-    if event_id < 1:
-        raise ValueError(f"Event ID must be positive, got {event_id}")
-        
-    return event_id
+    return _check_int(event_id, "Event ID", 1)
 
 
 def sanitize_keyword(keyword: str) -> str:
@@ -170,21 +256,95 @@ def sanitize_keyword(keyword: str) -> str:
     return keyword
 
 
-def calculate_fetch_limit(requested_limit: int) -> int:
+def sanitize_keywords(keywords: Union[str, List[str]]) -> List[str]:
+    """
+    Sanitize and validate one or more search keywords.
+    
+    Args:
+        keywords: Single keyword or list of keywords
+        
+    Returns:
+        List of unique sanitized keywords in request order
+        
+    Raises:
+        ValueError: If any keyword is invalid or too many are given
+    """
+    if isinstance(keywords, str):
+        return [sanitize_keyword(keywords)]
+        
+    if not isinstance(keywords, list) or not keywords:
+        raise ValueError("Keywords must be a string or a non-empty list of strings")
+        
+    if len(keywords) > _MAX_KEYWORDS:
+        raise ValueError(f"Too many keywords (max {_MAX_KEYWORDS}), got {len(keywords)}")
+        
+    unique_keywords = []
+    for keyword in keywords:
+        keyword = sanitize_keyword(keyword)
+        if keyword not in unique_keywords:
+            unique_keywords.append(keyword)
+    return unique_keywords
+
+
+def search_key(title: Optional[str]) -> bytes:
+    """
+    Build the search key for an event title.
+    
+    The title is case-folded as text (so non-ASCII letters such as "ß"
+    match their folded forms) and then UTF-8 encoded; substring tests on
+    bytes use CPython's memchr-based search without the Unicode kind
+    dispatch of str.
+    
+    Args:
+        title: Event title (may be None)
+        
+    Returns:
+        Case-folded UTF-8 encoded title
+    """
+    return (title or "").casefold().encode("utf-8")
+
+
+def keyword_matcher(keywords: List[str]) -> Callable[[bytes], Any]:
+    """
+    Build a predicate matching search keys that contain any keyword.
+    
+    A single keyword is tested with a plain bytes substring check; several
+    keywords are compiled into one regex alternation so all of them are
+    scanned in a single pass inside the regex engine.
+    
+    Args:
+        keywords: Sanitized keywords
+        
+    Returns:
+        Predicate taking a search key built by search_key()
+    """
+    needles = [search_key(keyword) for keyword in keywords]
+    if len(needles) == 1:
+        needle = needles[0]
+        return lambda key: needle in key
+    return re.compile(b"|".join(re.escape(needle) for needle in needles)).search
+
+
+def calculate_fetch_limit(requested_limit: int, hit_rate: Optional[float] = None) -> int:
     """
     Calculate optimal fetch limit for search operations.
     
     When searching, we need to fetch more results than requested
-    to account for client-side filtering.
+    to account for client-side filtering. With an observed hit rate the
+    fetch is sized to yield requested_limit matches, rounded up to a
+    multiple of MIN_FETCH_LIMIT so drifting rates keep hitting the same
+    cached responses; otherwise a fixed multiplier is used.
     
     Args:
         requested_limit: Number of results requested by user
+        hit_rate: Observed share of events matching the keywords
         
     Returns:
         Optimal number of results to fetch from API
     """
-    fetch_limit = max(
-        requested_limit * Config.FETCH_MULTIPLIER,
-        Config.MIN_FETCH_LIMIT
-    )
-    return min(fetch_limit, Config.MAX_LIMIT)
\ No newline at end of file
+    if hit_rate is None:
+        fetch_limit = requested_limit * _FETCH_MULTIPLIER
+    else:
+        needed = math.ceil(requested_limit / max(hit_rate, _MIN_HIT_RATE))
+        fetch_limit = -(-needed // _MIN_FETCH_LIMIT) * _MIN_FETCH_LIMIT
+    return min(max(fetch_limit, _MIN_FETCH_LIMIT), _MAX_LIMIT)